@@ -10,6 +10,7 @@ Usage::
 :license: MIT, see LICENSE for more details.
 """
 
+from statuspageio.async_http_client import AsyncHttpClient
 from statuspageio.client import Client
 from statuspageio.configuration import Configuration
 from statuspageio.errors import (
@@ -20,7 +21,7 @@ from statuspageio.errors import (
     ResourceError,
     ServerError
 )
-from statuspageio.http_client import HttpClient
+from statuspageio.http_client import AttrDict, HttpClient
 from statuspageio.services import (
     ComponentsService,
     IncidentsService,
@@ -38,7 +39,9 @@ __all__ = [
     'ResourceError',
     'ServerError',
     'Configuration',
+    'AttrDict',
     'HttpClient',
+    'AsyncHttpClient',
     'PageService',
     'ComponentsService',
     'IncidentsService',
@@ -0,0 +1,180 @@
+from typing import Optional
+
+from statuspageio.configuration import Configuration
+from statuspageio.errors import ConfigurationError
+from statuspageio.http_client import AttrDict, HttpClient, _dumps, _loads
+
+try:
+    # httpx is an optional dependency, only needed for the async client.
+    import httpx  # type: ignore
+except ImportError:
+    httpx = None
+
+
+class AsyncHttpClient:
+    """
+    Async counterpart of :class:`statuspageio.HttpClient` built on :class:`httpx.AsyncClient`,
+    with HTTP/2 multiplexing so many in-flight requests share one connection.
+
+    Requires the optional ``httpx`` dependency (``pip install crunch-statuspageio[async]``).
+
+    Usage::
+
+      >>> async with AsyncHttpClient(config) as client:
+      ...     status, headers, components = await client.get(f'/pages/{page_id}/components.json')
+
+    Envelope handling, response wrapping and error dispatch are shared with the
+    synchronous client, so both return the same tuples and raise the same exceptions.
+    """
+
+    # Supported REST API version prefix.
+    API_VERSION = '/v1'
+
+    def __init__(self, config: Configuration) -> None:
+        """
+        :param :class:`statuspageio.Configuration` config: StatusPage.io client configuration.
+        :raises ConfigurationError: if the optional ``httpx`` dependency is not installed.
+        """
+        if httpx is None:
+            raise ConfigurationError('AsyncHttpClient requires the optional httpx dependency. '
+                                     'Install it with the "async" extra.')
+
+        self.config = config
+        self._client = httpx.AsyncClient(
+            http2=True,
+            base_url=f"{config.base_url}{self.API_VERSION}",
+            headers={'Authorization': 'OAuth ' + config.api_key},
+            timeout=float(config.timeout),
+            verify=config.verify_ssl,
+            limits=httpx.Limits(max_connections=config.pool_maxsize)
+        )
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying client and release its pooled connections.
+        """
+        await self._client.aclose()
+
+    async def __aenter__(self) -> 'AsyncHttpClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def get(self, url: str, params: Optional[dict] = None, **kwargs) -> tuple:
+        """
+        Send a GET request.
+
+        :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
+        :param dict params: (optional) Dictionary of query parameters.
+        :param dict **kwargs: (optional) Other parameters which are directly passed to :func:`httpx.AsyncClient.request`.
+        :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
+        :rtype: tuple
+        """
+
+        return await self.request('get', url, params=params, **kwargs)
+
+    async def post(self, url: str, body: Optional[dict] = None, **kwargs) -> tuple:
+        """
+        Send a POST request.
+
+        :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
+        :param dict body: (optional) Dictionary of body attributes that will be wrapped with envelope and json encoded.
+        :param dict **kwargs: (optional) Other parameters which are directly passed to :func:`httpx.AsyncClient.request`.
+        :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
+        :rtype: tuple
+        """
+
+        return await self.request('post', url, body=body, **kwargs)
+
+    async def put(self, url: str, body: Optional[dict] = None, **kwargs) -> tuple:
+        """
+        Send a PUT request.
+
+        :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
+        :param dict body: (optional) Dictionary of body attributes that will be wrapped with envelope and json encoded.
+        :param dict **kwargs: (optional) Other parameters which are directly passed to :func:`httpx.AsyncClient.request`.
+        :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
+        :rtype: tuple
+        """
+
+        return await self.request('put', url, body=body, **kwargs)
+
+    async def patch(self, url: str, body: Optional[dict] = None, **kwargs) -> tuple:
+        """
+        Send a PATCH request.
+
+        :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
+        :param dict body: (optional) Dictionary of body attributes that will be wrapped with envelope and json encoded.
+        :param dict **kwargs: (optional) Other parameters which are directly passed to :func:`httpx.AsyncClient.request`.
+        :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
+        :rtype: tuple
+        """
+
+        return await self.request('patch', url, body=body, **kwargs)
+
+    async def delete(self, url: str, params: Optional[dict] = None, **kwargs) -> tuple:
+        """
+        Send a DELETE request.
+
+        :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
+        :param dict params: (optional) Dictionary of query parameters.
+        :param dict **kwargs: (optional) Other parameters which are directly passed to :func:`httpx.AsyncClient.request`.
+        :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
+        :rtype: tuple
+        """
+
+        return await self.request('delete', url, params=params, **kwargs)
+
+    async def request(self, method: str, url: str, params: Optional[dict] = None,
+                      body: Optional[dict] = None, **kwargs) -> tuple:
+        """
+        Send an HTTP request.
+
+        Same semantics as :meth:`HttpClient.request`, minus ETag caching and streaming.
+
+        :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
+        :param dict params: (optional) Dictionary of query parameters.
+        :param dict body: (optional) Dictionary of body attributes that will be wrapped with envelope and json encoded.
+        :param dict **kwargs: (optional) Other parameters which are directly passed to :func:`httpx.AsyncClient.request`.
+        :raises RequestError: if authentication failed, invalid query parameter etc.
+        :raises RateLimitError: if rate limit exceeded.
+        :raises ResourceError: if requests payload included invalid attributes or were missing.
+        :raises ServerError: if StatusPage.io backend servers encounterered an unexpected condition.
+        :return: Tuple of three elements: (http status code, headers, response - either parsed json or plain text)
+        :rtype: tuple
+
+        :Keyword Arguments:
+            * :param dict headers: (optional) Dictionary of headers. Default: ``{}``.
+            * :param bool raw: (optional) Whether to wrap and uwrap the envelope. Default: ``False``.
+        """
+
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+
+        user_headers = kwargs.pop('headers', None)
+        if user_headers:
+            headers.update(user_headers)
+
+        raw = bool(kwargs.pop('raw', False))
+        container = kwargs.pop('container', None)
+
+        if body is not None:
+            headers['Content-Type'] = 'application/json'
+            payload = body if raw else HttpClient.wrap_envelope(container, body)
+            body = _dumps(payload)
+
+        resp = await self._client.request(method, url,
+                                          params=params,
+                                          content=body,
+                                          headers=headers,
+                                          **kwargs)
+
+        if not 200 <= resp.status_code < 300:
+            HttpClient.handle_error_response(resp)
+
+        if 'json' in resp.headers.get('Content-Type', ''):
+            resp_body = AttrDict(_loads(resp.content)) if raw else HttpClient.unwrap_envelope(_loads(resp.content))
+        else:
+            resp_body = resp.content
+
+        return (resp.status_code, resp.headers, resp_body)
@@ -11,7 +11,11 @@ class Configuration:
         base_url: Optional[str] = None,
         user_agent: Optional[str] = None,
         timeout=30,
-        verify_ssl=True
+        verify_ssl=True,
+        pool_connections=10,
+        pool_maxsize=10,
+        retries=3,
+        backoff_factor=0.2
     ):
         self.api_key = api_key
         self.page_id = page_id
@@ -20,3 +24,7 @@ class Configuration:
         self.user_agent = user_agent if user_agent is not None else 'StatusPage/v1 Python Client'
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.retries = retries
+        self.backoff_factor = backoff_factor
@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class ConfigurationError(Exception):
     """
     Exception raised in case of invalid client configuration e.g. no access token provided,
@@ -8,8 +11,15 @@ class ConfigurationError(Exception):
 class RateLimitError(Exception):
     """
     Exception raised when the rate limit was exceeded.
+
+    :attribute float retry_after: Seconds to wait before retrying, taken from the
+        ``Retry-After`` response header, or ``None`` when the server did not send one.
     """
 
+    def __init__(self, retry_after: Optional[float] = None) -> None:
+        self.retry_after = retry_after
+        super().__init__()
+
 
 class BaseError(Exception):
     """
@@ -22,7 +32,7 @@ class BaseError(Exception):
 
     :attribute int http_status: Http status code.
     :attribute str logref: Request unique identifier.
-    :attribute list errors: List of :class:`DotMap <dotmap.DotMap>` objects representing returned errors.
+    :attribute list errors: List of dictionaries representing returned errors.
 
     Each error object has following attributes:
     :attribute str code: The error code.
@@ -32,7 +42,7 @@ class BaseError(Exception):
     :attribute str field: (optional) Field name of the resource the error relates to, in the JSON pointer format.
     """
 
-    def __init__(self, http_status, errors_payload):
+    def __init__(self, http_status: int, errors_payload: list) -> None:
         """
         :param int http_status: Http status code.
         :param dict errors_payload: Json decoded payload from the errors response.
@@ -40,9 +50,16 @@ class BaseError(Exception):
         self.http_status = http_status
         self.errors = errors_payload
         self.logref = ''
+        self._message = None
+
+        super().__init__()
 
-        message = "\n".join([str(error) for error in self.errors])
-        super().__init__(message)
+    def __str__(self) -> str:
+        # Stringifying every error eagerly is wasted work when the caller only
+        # inspects attributes, so build the joined message on first use.
+        if self._message is None:
+            self._message = "\n".join(str(error) for error in self.errors)
+        return self._message
 
 
 class RequestError(BaseError):
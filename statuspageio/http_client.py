@@ -1,10 +1,18 @@
 import http.client as http_client
 import json
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Iterator, List, NoReturn, Optional, Union
 
 import requests
-from dotmap import DotMap  # type: ignore
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry  # type: ignore
 
+from statuspageio.configuration import Configuration
 from statuspageio.errors import (
     RateLimitError,
     RequestError,
@@ -12,6 +20,78 @@ from statuspageio.errors import (
     ServerError
 )
 
+try:
+    # orjson is an optional accelerator; the stdlib codec is used when it is not installed.
+    import orjson  # type: ignore
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        # Match orjson and hand requests ready-made bytes, sparing it a second encode pass.
+        return json.dumps(obj).encode('utf-8')
+    _loads = json.loads
+
+try:
+    # ijson is an optional accelerator enabling incremental parsing of streamed responses.
+    import ijson  # type: ignore
+except ImportError:
+    ijson = None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header into seconds, accepting both the
+    delta-seconds and the HTTP-date form. Returns ``None`` when absent or malformed.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class AttrDict(dict):
+    """
+    A :class:`dict` subclass that also supports attribute-style access, a la JavaScript.
+
+    Unlike recursive wrappers it does not copy its contents up front; nested
+    dictionaries — including those inside lists — are wrapped lazily, on first
+    attribute access.
+    """
+
+    def __getattr__(self, name: str):
+        try:
+            value = self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        wrapped = self._wrap(value)
+        if wrapped is not value:
+            self[name] = wrapped
+        return wrapped
+
+    @staticmethod
+    def _wrap(value):
+        if type(value) is dict:  # pylint: disable=unidiomatic-typecheck
+            return AttrDict(value)
+        if type(value) is list:  # pylint: disable=unidiomatic-typecheck
+            wrapped = [AttrDict._wrap(item) for item in value]
+            if all(new is old for new, old in zip(wrapped, value)):
+                return value
+            return wrapped
+        return value
+
+    __setattr__ = dict.__setitem__
+    __delattr__ = dict.__delitem__  # type: ignore
+
 
 class HttpClient:
     """
@@ -21,13 +101,60 @@ class HttpClient:
     # Supported REST API version prefix.
     API_VERSION = '/v1'
 
-    def __init__(self, config):
+    # Maximum number of GET responses kept for ETag revalidation.
+    ETAG_CACHE_SIZE = 128
+
+    # Error dispatch: exact status codes first, then the client/server ranges.
+    _SPECIFIC_ERRORS = {422: ResourceError}
+    _CLIENT_RANGE = range(400, 500)
+    _SERVER_RANGE = range(500, 600)
+
+    def __init__(self, config: Configuration) -> None:
         """
         :param :class:`statuspageio.Configuration` config: StatusPage.io client configuration.
         """
         self.config = config
 
-    def get(self, url, params=None, **kwargs):
+        # Constants for the lifetime of the client, computed once instead of per request.
+        self._base = f"{config.base_url}{self.API_VERSION}"
+        self._timeout = float(config.timeout)
+        self._verify = config.verify_ssl
+        self._default_headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+
+        self._session = requests.Session()
+        self._session.headers.update({'Authorization': 'OAuth ' + config.api_key})
+
+        adapter = HTTPAdapter(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            max_retries=Retry(
+                total=config.retries,
+                backoff_factor=config.backoff_factor,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(['GET', 'HEAD', 'PUT', 'DELETE'])
+            )
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+        # LRU cache of (etag, response tuple) per GET endpoint, used for If-None-Match revalidation.
+        # The lock keeps it consistent when requests are dispatched concurrently via bulk().
+        self._etag_cache = OrderedDict()
+        self._etag_lock = threading.Lock()
+
+    def close(self) -> None:
+        """
+        Close the underlying session and release its pooled connections.
+        """
+        self._session.close()
+
+    def __enter__(self) -> 'HttpClient':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def get(self, url: str, params: Optional[dict] = None, **kwargs) -> tuple:
         """
         Send a GET request.
 
@@ -40,7 +167,7 @@ class HttpClient:
 
         return self.request('get', url, params=params, **kwargs)
 
-    def post(self, url, body=None, **kwargs):
+    def post(self, url: str, body: Optional[dict] = None, **kwargs) -> tuple:
         """
         Send a POST request.
 
@@ -53,7 +180,7 @@ class HttpClient:
 
         return self.request('post', url, body=body, **kwargs)
 
-    def put(self, url, body=None, **kwargs):
+    def put(self, url: str, body: Optional[dict] = None, **kwargs) -> tuple:
         """
         Send a PUT request.
 
@@ -66,7 +193,7 @@ class HttpClient:
 
         return self.request('put', url, body=body, **kwargs)
 
-    def patch(self, url, body=None, **kwargs):
+    def patch(self, url: str, body: Optional[dict] = None, **kwargs) -> tuple:
         """
         Send a PATCH request.
 
@@ -79,7 +206,7 @@ class HttpClient:
 
         return self.request('patch', url, body=body, **kwargs)
 
-    def delete(self, url, params=None, **kwargs):
+    def delete(self, url: str, params: Optional[dict] = None, **kwargs) -> tuple:
         """
         Send a DELETE request.
 
@@ -92,7 +219,36 @@ class HttpClient:
 
         return self.request('delete', url, params=params, **kwargs)
 
-    def request(self, method, url, params=None, body=None, **kwargs):
+    def bulk(self, operations: Iterable[tuple], max_workers: int = 8) -> List[tuple]:
+        """
+        Send several independent requests concurrently over the shared keep-alive session.
+
+        The requests are dispatched through a thread pool, so the total wall time is
+        bounded by the slowest request instead of the sum of all round trips. The first
+        request that raises aborts the call and its exception is re-raised.
+
+        :param iterable operations: Iterable of ``(method, url, body, container)`` tuples.
+            ``body`` and ``container`` may be ``None`` for requests without a payload.
+        :param int max_workers: (optional) Number of worker threads. Default: ``8``.
+        :return: List of result tuples, in the same order as :param:`operations`.
+        :rtype: list
+        """
+
+        def dispatch(operation):
+            method, url, body, container = operation
+            if body is None:
+                return self.request(method, url)
+            return self.request(method, url, body=body, container=container)
+
+        operations = list(operations)
+        if not operations:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(dispatch, operations))
+
+    def request(self, method: str, url: str, params: Optional[dict] = None,
+                body: Optional[dict] = None, **kwargs) -> tuple:
         """
         Send an HTTP request.
 
@@ -100,8 +256,12 @@ class HttpClient:
         will be wrapped with envelope the API expects and json encoded.
 
         When you get a reponse the method will try to json decode the response,
-        if the media type represents json, unwrap the envelope and munchify what has left,
-        for JavaScript like access.
+        if the media type represents json, unwrap the envelope and wrap what has left
+        in :class:`AttrDict`, for JavaScript like access.
+
+        GET responses carrying an ``ETag`` are cached and revalidated with
+        ``If-None-Match`` on subsequent calls, so an unchanged resource comes back
+        as a cheap ``304 Not Modified`` and the cached body is returned instead.
 
         :param str url: Sub URL for the request. You MUST not specify neither base url nor api version prefix.
         :param dict params: (optional) Dictionary of query parameters.
@@ -117,79 +277,199 @@ class HttpClient:
         :Keyword Arguments:
             * :param dict headers: (optional) Dictionary of headers. Default: ``{}``.
             * :param bool raw: (optional) Whether to wrap and uwrap the envelope. Default: ``False``.
+            * :param bool stream: (optional) Whether to stream the response and return a generator
+              that yields the envelope items one at a time, bounding peak memory on large list
+              responses. Default: ``False``.
         """
 
-        url = f"{self.config.base_url}{self.API_VERSION}{url}"
+        url = self._base + url
 
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Authorization": "OAuth " + self.config.api_key
-        }
+        headers = dict(self._default_headers)
 
-        user_headers = {}
-        if 'headers' in kwargs and isinstance(kwargs['headers'], dict):
-            user_headers = kwargs['headers']
+        user_headers = kwargs.pop('headers', None)
+        if user_headers:
+            headers.update(user_headers)
 
-        headers.update(user_headers)
-
-        raw = bool(kwargs['raw']) if 'raw' in kwargs else False
+        raw = bool(kwargs.pop('raw', False))
+        stream = bool(kwargs.pop('stream', False))
+        container = kwargs.pop('container', None)
 
         if body is not None:
             headers['Content-Type'] = 'application/json'
-            payload = body if raw else self.wrap_envelope(kwargs['container'], body)
-            body = json.dumps(payload)
-
-        resp = requests.request(method, url,
-                                params=params,
-                                data=body,
-                                headers=headers,
-                                timeout=float(self.config.timeout),
-                                verify=self.config.verify_ssl)
+            payload = body if raw else self.wrap_envelope(container, body)
+            body = _dumps(payload)
+
+        cache_key = None
+        if method == 'get' and not stream:
+            try:
+                cache_key = (url, tuple(sorted(params.items())) if params else None)
+                with self._etag_lock:
+                    cached = self._etag_cache.get(cache_key)
+            except TypeError:
+                # Unhashable param values (e.g. list-valued filters) cannot key the
+                # cache; skip revalidation for this call rather than fail the request.
+                cache_key = None
+            else:
+                if cached is not None:
+                    headers['If-None-Match'] = cached[0]
+
+        request_kwargs = {
+            'params': params,
+            'data': body,
+            'headers': headers,
+            'timeout': self._timeout,
+            'verify': self._verify,
+            'stream': stream,
+        }
+        # Overlay the caller's kwargs so values like timeout= or verify= win over
+        # the presets instead of raising a duplicate-keyword TypeError.
+        request_kwargs.update(kwargs)
+
+        resp = self._session.request(method, url, **request_kwargs)
+
+        if resp.status_code == 304 and cache_key is not None:
+            with self._etag_lock:
+                cached = self._etag_cache.get(cache_key)
+                if cached is not None:
+                    self._etag_cache.move_to_end(cache_key)
+            if cached is not None:
+                # The cache holds the undecoded body bytes; decode per call so the
+                # raw flag is honored and no mutable state is shared between callers.
+                _, cached_status, cached_headers, cached_content = cached
+                if 'json' in cached_headers.get('Content-Type', ''):
+                    parsed = _loads(cached_content)
+                    cached_body = AttrDict(parsed) if raw else self.unwrap_envelope(parsed)
+                else:
+                    cached_body = cached_content
+                return (cached_status, cached_headers, cached_body)
+            # The entry was evicted between the conditional send and the 304
+            # (concurrent GETs via bulk() can churn the cache), so the body is
+            # gone on both ends; re-fetch unconditionally.
+            headers.pop('If-None-Match', None)
+            resp = self._session.request(method, url, **request_kwargs)
 
         if not 200 <= resp.status_code < 300:
             self.handle_error_response(resp)
 
-        if 'Content-Type' in resp.headers and 'json' in resp.headers['Content-Type']:
-            resp_body = DotMap(resp.json()) if raw else self.unwrap_envelope(resp.json())
+        # Single lookup into the CaseInsensitiveDict; each access normalizes the key.
+        is_json = 'json' in resp.headers.get('Content-Type', '')
+
+        if is_json:
+            if stream:
+                resp_body = self.stream_envelope(resp)
+            else:
+                parsed = _loads(resp.content)
+                resp_body = AttrDict(parsed) if raw else self.unwrap_envelope(parsed)
         else:
             resp_body = resp.content
 
+        if cache_key is not None:
+            etag = resp.headers.get('ETag')
+            if etag:
+                # Store the immutable body bytes, not the decoded tree: callers are
+                # free to mutate what request() hands them without poisoning the cache.
+                with self._etag_lock:
+                    self._etag_cache[cache_key] = (etag, resp.status_code, resp.headers, resp.content)
+                    self._etag_cache.move_to_end(cache_key)
+                    if len(self._etag_cache) > self.ETAG_CACHE_SIZE:
+                        self._etag_cache.popitem(last=False)
+
         return (resp.status_code, resp.headers, resp_body)
 
     @staticmethod
-    def handle_error_response(resp):
+    def handle_error_response(resp: requests.Response) -> NoReturn:
+        resp_code = resp.status_code
+
+        # Rate limit responses carry no useful payload; skip the body parse entirely
+        # and surface the advertised backoff so callers can sleep precisely.
+        if resp_code in (420, 429):
+            raise RateLimitError(retry_after=_parse_retry_after(resp.headers.get('Retry-After')))
+
+        error_class = HttpClient._SPECIFIC_ERRORS.get(resp_code)
+        if error_class is None:
+            if resp_code in HttpClient._CLIENT_RANGE:
+                error_class = RequestError
+            elif resp_code in HttpClient._SERVER_RANGE:
+                error_class = ServerError
+        if error_class is None:
+            raise Exception(f'Unknown HTTP error response. HTTP response code={resp_code}.')
+
+        # Read the body bytes once and reuse the same buffer for parsing and
+        # diagnostics; resp.text would re-decode the cached bytes on every access.
+        buf = resp.content
+
+        # Check the media type up front: feeding an HTML error page to the JSON
+        # parser just to catch the exception is far more expensive than this lookup.
+        if 'json' not in resp.headers.get('Content-Type', ''):
+            raise Exception('Unknown HTTP error response. Json expected. '
+                            f'HTTP response code={resp_code}. '
+                            f'HTTP response body={buf[:1024]!r}')
+
         try:
-            errors = resp.json()
+            errors = _loads(buf)
         except Exception as e:
             raise Exception('Unknown HTTP error response. Json expected. '
-                            f'HTTP response code={resp.status_code}. '
-                            f'HTTP response body={resp.text}') from e
+                            f'HTTP response code={resp_code}. '
+                            f'HTTP response body={buf[:1024]!r}') from e
 
-        resp_code = resp.status_code
-        if resp_code == 422:
-            raise ResourceError(resp_code, errors)
-        if resp_code == 420:
-            raise RateLimitError()
-        if 400 <= resp_code < 500:
-            raise RequestError(resp_code, errors)
-        if 500 <= resp_code < 600:
-            raise ServerError(resp_code, errors)
-        raise Exception('Unknown HTTP error response')
+        raise error_class(resp_code, errors)
 
     @staticmethod
-    def wrap_envelope(container, body):
+    def wrap_envelope(container: Optional[str], body: dict) -> dict:
         """ Wrap the body with the correct container to match the API """
         return {container: body}
 
     @staticmethod
-    def unwrap_envelope(body):
-        return [DotMap(item) for item in body['items']] if 'items' in body else DotMap(body)
+    def unwrap_envelope(body: dict) -> Union[List[AttrDict], AttrDict]:
+        return [AttrDict(item) for item in body['items']] if 'items' in body else AttrDict(body)
 
     @staticmethod
-    def enable_logging():
-        http_client.HTTPConnection.debuglevel = 1
+    def stream_envelope(resp: requests.Response) -> Iterator[AttrDict]:
+        """
+        Yield the items of an enveloped list response one at a time.
+
+        Only meant for list endpoints, i.e. responses carrying an ``items`` envelope.
+
+        With ijson installed the body is parsed incrementally straight off the socket,
+        so peak memory is bounded by a single item. Without it the whole body is
+        buffered first and the generator merely iterates the parsed envelope.
+        """
+        try:
+            if ijson is not None:
+                resp.raw.decode_content = True
+                for item in ijson.items(resp.raw, 'items.item'):
+                    yield AttrDict(item)
+            else:
+                body = _loads(resp.content)
+                if 'items' in body:
+                    for item in body['items']:
+                        yield AttrDict(item)
+                else:
+                    yield AttrDict(body)
+        finally:
+            resp.close()
+
+    @staticmethod
+    def enable_logging(level: int = logging.INFO, wire: bool = False) -> None:
+        """
+        Enable logging of the underlying http machinery.
+
+        :param int level: (optional) Level for the root and urllib3 loggers. Default: ``logging.INFO``.
+        :param bool wire: (optional) Also dump every byte sent and received on the wire.
+            This is very expensive — easily an order of magnitude slowdown on large
+            responses — so it has to be requested explicitly. Default: ``False``.
+        """
+        http_client.HTTPConnection.debuglevel = 1 if wire else 0
         logging.basicConfig()
-        logging.getLogger().setLevel(logging.DEBUG)
+        logging.getLogger().setLevel(level)
         requests_log = logging.getLogger("requests.packages.urllib3")
-        requests_log.setLevel(logging.DEBUG)
+        requests_log.setLevel(level)
         requests_log.propagate = True
+
+    @staticmethod
+    def disable_logging() -> None:
+        """
+        Undo :meth:`enable_logging`: turn off wire dumps and quiet the urllib3 logger.
+        """
+        http_client.HTTPConnection.debuglevel = 0
+        logging.getLogger("requests.packages.urllib3").setLevel(logging.WARNING)